@@ -151,10 +151,13 @@ class Bundle(OrderedDict):
         rules = list()
         if 'rules' in alg:
             for rule in alg['rules']:
-                for d in [rule['predicate'], rule['move']]:
-                    d['filename'] = self._canonicalize_path(d['filename'])
-                pred = core.Predicate(**rule['predicate'])
-                move = core.Move(**rule['move'])
+                # components shared between rules are the same dictionary
+                # (see normalize), so canonicalize a copy rather than
+                # rewriting the shared filename once per use
+                pred_spec, move_spec = [dict(d, filename=self._canonicalize_path(d['filename']))
+                                        for d in [rule['predicate'], rule['move']]]
+                pred = core.Predicate(**pred_spec)
+                move = core.Move(**move_spec)
                 rules.append(core.Rule(pred, move))
         return core.Algorithm(rules)
 
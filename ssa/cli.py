@@ -2,7 +2,12 @@ import ssa
 
 import argparse
 import logging
-from typing import Dict
+import os
+import random
+import shutil
+import sys
+import yaml
+from typing import Any, Callable, Dict, List, Set, Tuple
 from collections import OrderedDict
 
 # todo: what to do if bundle.ssax does not exist?  a new verb, albiet backwards, called 'create'?
@@ -77,6 +82,9 @@ def new_algorithm(bundle, name, **kwargs):
     logging.info(f"New '{bundle}' algorithm name: {name}")
     _load_bundle(bundle).add_algorithm(name).save()
 
+# 64 KiB, the size of a typical pipe buffer
+COPY_BUFFER_SIZE = 64 * 1024
+
 def _new_component(bundle_path, component_dir, file, new_name, method, **kwargs):
     """Copy a bundle component (predicate/move) to the bundle.
 
@@ -86,22 +94,21 @@ def _new_component(bundle_path, component_dir, file, new_name, method, **kwargs)
       - method :: what method on Bundle to use to add the component (e.g., Bundle.add_move)
 
     """
-    import sys, os
     bundle = _load_bundle(bundle_path)
 
-    if file is sys.stdin:
-        lines = sys.stdin.readlines()
-    else:
-        with open(file, 'r') as f:
-            lines = f.readlines()
-
     newpath = os.path.join(bundle_path, component_dir, new_name)
 
     # ensure parent directories exist
     os.makedirs(os.path.dirname(os.path.realpath(newpath)), exist_ok=True)
 
-    with open(newpath, 'w') as f:
-        f.writelines(lines)
+    # copy the code across as raw bytes in pipe-buffer-sized chunks
+    # rather than splitting it into a list of lines and joining it
+    # back up again
+    if file is sys.stdin:
+        with open(newpath, 'wb') as out:
+            shutil.copyfileobj(sys.stdin.buffer, out, COPY_BUFFER_SIZE)
+    else:
+        shutil.copyfile(file, newpath)
 
     properties = list()
     if 'property' in kwargs:
@@ -114,23 +121,37 @@ def _new_component(bundle_path, component_dir, file, new_name, method, **kwargs)
 def new_predicate(bundle, name, **kwargs):
     """Add the predicate at the given path to the bundle."""
     logging.info(f"In bundle '{bundle}', saving predicate code from standard input to {name} (relative to the bundle).")
-    import sys
     _new_component(bundle, 'predicate', sys.stdin, name, ssa.Bundle.add_predicate, **kwargs)
 
 def new_move(bundle, name, **kwargs):
     """Add the move at the given path to the bundle."""
     logging.info(f"In bundle '{bundle}', saving move code from standard input to {name} (relative to the bundle).")
-    import sys
     _new_component(bundle, 'move', sys.stdin, name, ssa.Bundle.add_move, **kwargs)
 
 def add_rule_to(bundle, algorithm_name, predicate, move, **kwargs):
     """Add a rule to an algorithm."""
     logging.info(f"In bundle '{bundle}', adding a new rule ({predicate} => {move}) to {algorithm_name}.")
-    import os
     _load_bundle(bundle).add_rule_to_algorithm(algorithm_name, os.path.join('predicate', predicate), os.path.join('move', move)).save()
 
+def _parse_spec(spec: str) -> Tuple[str, List[str]]:
+    """Split a generator spec 'name,arg,...' into its name and arguments."""
+    # note this has no understanding of 'escaping' commas
+    name, *args = spec.split(',')
+    return (name, args)
+
+def _resolve_value_generator(prop: str, genspec: str) -> Callable[[], Any]:
+    """Resolve a property-value generator spec for `prop` to a generator."""
+    import ssa.trial
+    gen, genargs = _parse_spec(genspec)
+    resolved = ssa.trial.get_value_generator(gen)
+    if resolved is None:
+        raise Exception(f"unknown property randomizer '{gen}' for property '{prop}'")
+    return resolved(*genargs)
+
 def run_algorithm(bundle, algorithm_name, graph_generator_spec: str, iterations, num_graphs, **kwargs):
     """Run an algorithm from a bundle."""
+    # ssa.trial pulls in networkx, so only import it for the commands
+    # that need it
     import ssa.trial
     logging.info(f"Algorithm: {algorithm_name} ({bundle})")
     logging.info(f"Generator: {graph_generator_spec}")
@@ -138,8 +159,21 @@ def run_algorithm(bundle, algorithm_name, graph_generator_spec: str, iterations,
     logging.info(f"Graphs: {num_graphs}")
     algorithm = ssa.Bundle.load(bundle).load_algorithm(algorithm_name)
 
+    # graph and property generators all draw from the module-level
+    # RNG, so seeding it once here makes a run repeatable -- but only
+    # with a single worker, since otherwise the order of draws depends
+    # on thread scheduling.  a seeded run therefore defaults to one
+    # worker.
+    if kwargs.get('seed') is not None:
+        logging.info(f"Seed: {kwargs['seed']}")
+        random.seed(kwargs['seed'])
+        if kwargs.get('workers') is None:
+            kwargs['workers'] = 1
+        elif kwargs['workers'] != 1:
+            logging.warning(f"--seed with {kwargs['workers']} workers: results will not be reproducible (use --workers=1)")
+
     # the spec tells us how to generate random graphs
-    graph_gen_descriptor, *graph_gen_args = graph_generator_spec.split(',')
+    graph_gen_descriptor, graph_gen_args = _parse_spec(graph_generator_spec)
     # generator,arg,...:prop=generator,arg,...:...
 
     # try to get the right graph-generator-generator using a standard prefix
@@ -151,36 +185,41 @@ def run_algorithm(bundle, algorithm_name, graph_generator_spec: str, iterations,
     # by calling it with the arguments we were given (unpacked)
     graphgen = graph_gen_parser(*graph_gen_args)
 
+    # allow overrides; does not do type-checking yet, but this could
+    # be done with the specified return type of the generator.  This
+    # would probably involve splitting the loop below into two passes.
+    overrides = {p[0]: p[1] for p in kwargs.get('property_override') or []}
+
     # collect the properties (ie, node attributes) needed by the
-    # components of this algorithm (checking for conflicts)
+    # components of this algorithm (checking for conflicts).  an
+    # overridden property is replaced wholesale, so whatever the
+    # components say about it doesn't matter -- not even if they
+    # disagree.
     props: Dict[str, str] = dict()
+    # the same predicate or move is commonly shared between rules;
+    # since each rule is loaded as its own Executable, recognize
+    # repeats by their source file and only check their properties
+    # once.
+    seen: Set[str] = set()
     for rule in algorithm.rules:
         # typing -- see python/mypy#708
         for component in (rule.predicate, rule.move): # type: ignore
-            if not isinstance(component, ssa.core.Executable):
+            if not isinstance(component, ssa.core.Executable) or component.source_file in seen:
                 continue
-            component_props = {p['name']: p['generator'] for p in component._props}
-            for name, gen in component_props.items():
+            seen.add(component.source_file)
+            for p in component._props or []:
+                name, gen = p['name'], p['generator']
+                if name in overrides:
+                    continue
                 if name not in props:
                     props[name] = gen
                 elif props[name] != gen:
                     raise Exception(f"Shared node attribute found with conflicting generators: {name} (existing '{props[name]}', new '{gen}')")
 
-    # allow overrides; does not do type-checking yet, but this could
-    # be done with the specified return type of the generator.  This
-    # would probably involve splitting the loop below into two passes.
-    if 'property_override' in kwargs and kwargs['property_override']:
-        props.update({p[0]: p[1] for p in kwargs['property_override']})
+    props.update(overrides)
 
     # build up the properties dictionary for apply_properties
-    properties = dict()
-    for prop, genspec in props.items():
-        gen, *genargs = genspec.split(',')
-        # note the solution above has no understanding of 'escaping' commas
-        resolved = ssa.trial.get_value_generator(gen)
-        if not resolved:
-            raise Exception("unknown property randomizer")
-        properties[prop] = resolved(*genargs)
+    properties = {prop: _resolve_value_generator(prop, genspec) for prop, genspec in props.items()}
 
     # convert our command-line arguments to the names used by ssa.trial.run
     kwargs_to_run_args = {
@@ -204,7 +243,6 @@ def run_algorithm(bundle, algorithm_name, graph_generator_spec: str, iterations,
         print("All graphs converged.")
 
 def yaml_print_all(l: list):
-    import sys, yaml
     yaml.dump_all(l, sys.stdout, default_flow_style=False)
 
 def list_algorithms(bundle, **kwargs):
@@ -283,6 +321,7 @@ CLIParser = populate_parser(argparse.ArgumentParser(), {
             "$options": {
                "--timeout": { 'type': int },
                "--workers": { 'type': int },
+               "--seed": { 'type': int },
                ("-p", "--property-override"): PROPSPEC
                 # todo:
                 # --graph-file=graph.gml --format=gml
@@ -314,7 +353,6 @@ CLIParser = populate_parser(argparse.ArgumentParser(), {
 
 def run():
     """Parse and handle command line arguments."""
-    import os
     LOG_LEVEL = "LOG_LEVEL"
     if LOG_LEVEL in os.environ:
         logging.basicConfig(level=getattr(logging, os.environ[LOG_LEVEL]))
@@ -1,8 +1,13 @@
-import networkx as nx
 import random
 import copy
 import logging
-from typing import List, Callable, NewType, Optional, Dict, Tuple, Union, cast, Any
+from typing import List, Callable, NewType, Optional, Dict, Tuple, Union, cast, Any, TYPE_CHECKING
+
+# networkx is only needed here for annotations; importing it costs
+# most of the CLI's startup time, and commands other than 'run' never
+# touch a graph.
+if TYPE_CHECKING:
+    import networkx as nx
 
 TNode = NewType("TNode", object)
 TPred = Callable[[TNode, List[TNode]], bool]
@@ -61,11 +66,11 @@ class Executable:
         return self._code
 
     def _define(self):
-        """Read `self.source_file` and load it into memory."""
+        """Read `self.source_file` and compile it, once, into a code object."""
         logging.debug(f"Loading {self.source_file}")
         with open(self.source_file) as f:
-            lines = f.readlines()
-        self._code = compile('\n'.join(lines), self.source_file, 'exec')
+            source = f.read()
+        self._code = compile(source, self.source_file, 'exec')
 
 class Predicate(Executable):
     """A Boolean-valued function of a node and its neighbors.
@@ -148,6 +153,10 @@ class GraphTimeline:
     """
     # todo: implement __iter__ to yeild graphs at steps
     class Step:
+        # one of these is recorded for every move of every run, so
+        # don't carry a per-instance __dict__
+        __slots__ = ('rule', 'node', 'new_data')
+
         def __init__(self, rule: Rule, node: TNode, new_data: TNode) -> None:
             """Create a new 'step'.
 
@@ -166,7 +175,7 @@ class GraphTimeline:
         def __str__(self):
             return f"<Step {self.rule} on {self.node} yeilds {self.new_data}>"
 
-    def __init__(self, base: nx.Graph) -> None:
+    def __init__(self, base: 'nx.Graph') -> None:
         self._base = base
         self._end: Optional[nx.Graph] = None
         self._steps: List[GraphTimeline.Step] = list()
@@ -185,7 +194,7 @@ class Algorithm:
     def __init__(self, rules: List[Rule]) -> None:
         self.rules = rules
 
-    def run(self, graph: nx.Graph, max_steps: int = None) -> Tuple[bool, GraphTimeline]:
+    def run(self, graph: 'nx.Graph', max_steps: int = None) -> Tuple[bool, GraphTimeline]:
         """Run an algorithm on a graph.
 
         Returns a tuple of
@@ -224,7 +233,7 @@ class Algorithm:
 
         return (stable, timeline)
 
-    def find_privileged_nodes(self, graph: nx.Graph) -> Dict[TNode, Tuple[List[TNode], List[Rule]]]:
+    def find_privileged_nodes(self, graph: 'nx.Graph') -> Dict[TNode, Tuple[List[TNode], List[Rule]]]:
         """Find and return the 'privileged' nodes in `graph`.
 
         Privileged nodes are those nodes in the graph that satisfy one
@@ -238,16 +247,19 @@ class Algorithm:
         privileged = dict()
         # This loop could potentially be slow: nodes * neighbors * rules
         # (not even counting the predicate logic)
+        node_data = graph.node
         for node in graph:
             applicable_rules = []
 
-            # collect neighbor data for the predicate
+            # collect neighbor data for the predicate straight into a
+            # list (no intermediate dictionary per node)
             neighbors = cast(List[TNode], # satisfy type-checker
-                             {v: graph.node[v] for v in graph.neighbors(node)}.values())
+                             [node_data[v] for v in graph.neighbors(node)])
 
             # search for applicable rules
+            data = node_data[node]
             for rule in self.rules:
-                if rule.applies_to(graph.node[node], neighbors):
+                if rule.applies_to(data, neighbors):
                     applicable_rules.append(rule)
 
             # record any applicable rules in the dictionary
@@ -255,7 +267,7 @@ class Algorithm:
                 privileged[cast(TNode, node)] = (neighbors, applicable_rules)
         return privileged
 
-    def pick_node_under_rule(self, graph: nx.Graph) -> Tuple[Optional[TNode], Optional[List[TNode]], Optional[Rule]]:
+    def pick_node_under_rule(self, graph: 'nx.Graph') -> Tuple[Optional[TNode], Optional[List[TNode]], Optional[Rule]]:
         """Find one node in `graph` to which a rule applies.
 
         Return a tuple (node, rule).
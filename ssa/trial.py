@@ -25,19 +25,21 @@ def arg(name, description):
 
 def apply_properties(graph: nx.Graph, property_generators: Dict[str, Callable[[], Any]]) -> nx.Graph:
     """Apply properties to a graph given a dictionary of properties."""
-    for node in graph.nodes:
-        n = graph.node[node]
-        for prop in property_generators:
-            n[prop] = property_generators[prop]()
+    # fill in one property at a time across all nodes so each
+    # generator is looked up once rather than once per node
+    node_data = [data for _, data in graph.nodes(data=True)]
+    for prop, generator in property_generators.items():
+        for data in node_data:
+            data[prop] = generator()
     return graph
 
 def get_value_generator(member: str):
-    """Find a property-value generator by a given name."""
-    return globals()['genp_'+member] # GENerate Property
+    """Find a property-value generator by a given name (None if there is no such generator)."""
+    return globals().get('genp_'+member) # GENerate Property
 
 def get_graph_generator_parser(member: str):
-    """Find a graph generator by a given name."""
-    return globals()['geng_'+member] # GENerate Graph
+    """Find a graph generator by a given name (None if there is no such generator)."""
+    return globals().get('geng_'+member) # GENerate Graph
 
 def get_generators(prefix: str):
     """Get a list of all known generators."""
@@ -90,24 +92,41 @@ def _get_signature_arguments(function_code_object) -> List[Tuple[str, Optional[s
 # and return a function that returns a random graph.
 # (we need this layer of indirection to avoid creating the graph
 # too early).  only required and optional-named parameters are
-# supported (i.e., no keyword arguments).
+# supported (i.e., no keyword arguments).  arguments are parsed when
+# the spec is resolved, not every time a graph or value is generated,
+# so a malformed spec fails once and up-front.
 @description("Generate a random graph with a set number of nodes")
 @arg("number_of_nodes", "The graph generated will have this many nodes")
 def geng_gn(number_of_nodes: str):
     """Return a graph-generator that gives a graph of a set number of nodes."""
-    return lambda: nx.generators.gn_graph(int(number_of_nodes))
+    n = int(number_of_nodes)
+    return lambda: nx.generators.gn_graph(n)
 
 @description("Generate a random graph with a set number of nodes and edges")
 @arg("number_of_nodes", "The graph generated will have this many nodes")
 @arg("number_of_edges", "The graph generated will have this many edges")
 def geng_gnm(number_of_nodes: str, number_of_edges: str):
     """Return a graph-generator that gives a graph of a set number of nodes and edges."""
-    return lambda: nx.generators.gnm_random_graph(int(number_of_nodes), int(number_of_edges))
+    n, m = int(number_of_nodes), int(number_of_edges)
+    return lambda: nx.generators.gnm_random_graph(n, m)
+
+@description("Generate a random graph where each edge exists with a set probability")
+@arg("number_of_nodes", "The graph generated will have this many nodes")
+@arg("edge_probability", "The probability that any given edge exists")
+def geng_gnp(number_of_nodes: str, edge_probability: str):
+    """Return a graph-generator that gives an Erdős-Rényi G(n,p) graph."""
+    n, p = int(number_of_nodes), float(edge_probability)
+    # fast_gnp_random_graph skips geometrically over the pairs that
+    # are not edges, so its cost is in the edges actually produced
+    # rather than in all n(n-1)/2 candidate pairs.
+    return lambda: nx.generators.fast_gnp_random_graph(n, p)
 
 @description("A random boolean")
 def genp_bool() -> Callable[[], bool]:
     """Random boolean generator."""
-    return lambda: random.random() <= 0.5
+    # a single random bit is a fair coin, and is cheaper to draw than
+    # a float to compare against 0.5
+    return lambda: random.getrandbits(1) == 1
 
 @description("A random choice")
 @arg("choices", "a list of choices")
@@ -122,15 +141,17 @@ def genp_rangef(min: str, max: str) -> Callable[[], float]:
     """Random real in range [min, max)."""
     if min == '0' and max == '1':
         return random.random
-    minf = float(min)
-    return lambda: random.random() * (float(max) - minf) + minf
+    minf, maxf = float(min), float(max)
+    width = maxf - minf
+    return lambda: random.random() * width + minf
 
 @description("A random integer")
 @arg("min", "the minimum possible value, inclusive")
 @arg("max", "the maximum possible value, exclusive")
 def genp_range(min: str, max: str) -> Callable[[], int]:
     """Random integer in range [min, max]."""
-    return lambda: random.randint(int(min), int(max))
+    mini, maxi = int(min), int(max)
+    return lambda: random.randint(mini, maxi)
 
 def run(algorithm: ssa.Algorithm, graph_generator: Callable[[], nx.Graph], num_iterations: int, num_graphs: int, timeout_seconds: int = 120, workers: int = 32) -> Dict[bool, List[ssa.GraphTimeline]]:
     """Run an algorithm many, many times in parallel.